@@ -1,12 +1,20 @@
 # -- Project information -----------------------------------------------------
-import importlib.metadata
-
-metadata = importlib.metadata.metadata("gentools")
-
-project = metadata["Name"]
-author = metadata["Author"]
-version = metadata["Version"]
-release = metadata["Version"]
+# Read from pyproject.toml directly, instead of through the (slow)
+# importlib.metadata.
+from pathlib import Path
+
+try:
+    import tomllib
+except ImportError:  # python < 3.11
+    import tomli as tomllib
+
+with open(Path(__file__).resolve().parents[1] / "pyproject.toml", "rb") as f:
+    metadata = tomllib.load(f)["tool"]["poetry"]
+
+project = metadata["name"]
+author = metadata["authors"][0].split(" <")[0]
+version = metadata["version"]
+release = metadata["version"]
 
 
 # -- General configuration ------------------------------------------------
@@ -1,6 +1,50 @@
-from .core import *  # noqa
-from .types import *  # noqa
+from importlib import import_module
 
-# Single-sourcing the version number with poetry:
-# https://github.com/python-poetry/poetry/pull/2366#issuecomment-652418094
-__version__ = __import__("importlib.metadata").metadata.version(__name__)
+# Names are loaded lazily on first access (PEP 562),
+# so that importing gentools itself is nearly free.
+_LAZY_NAMES = {
+    "reusable": "core",
+    "oneyield": "core",
+    "sendreturn": "core",
+    "relay": "core",
+    "map_yield": "core",
+    "map_send": "core",
+    "map_return": "core",
+    "compose": "core",
+    "imap_yield": "core",
+    "imap_send": "core",
+    "imap_return": "core",
+    "irelay": "core",
+    "Generable": "types",
+    "GeneratorCallable": "types",
+    "ReusableGenerator": "types",
+}
+_SUBMODULES = {"core", "types", "utils"}
+
+__all__ = list(_LAZY_NAMES)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import *  # noqa
+    from .types import *  # noqa
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(import_module("." + _LAZY_NAMES[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module("." + name, __name__)
+    elif name == "__version__":
+        # Single-sourcing the version number with poetry:
+        # https://github.com/python-poetry/poetry/pull/2366#issuecomment-652418094
+        value = import_module("importlib.metadata").version(__name__)
+    else:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
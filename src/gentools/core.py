@@ -1,9 +1,8 @@
-from functools import partial, reduce
-from inspect import getgeneratorstate, signature
-from operator import attrgetter, itemgetter
+from functools import wraps
+from weakref import WeakValueDictionary
 
 from .types import GeneratorCallable, ReusableGenerator, T_send, T_yield
-from .utils import compose
+from .utils import compose, identity
 
 __all__ = [
     "reusable",
@@ -21,8 +20,21 @@ __all__ = [
 ]
 
 
-def _is_just_started(gen):
-    return getgeneratorstate(gen) == "GEN_CREATED"
+# NOTE: ``inspect`` is imported lazily in this module.
+# It pulls in a large part of the standard library (``ast``, ``dis``,
+# ``tokenize``, ...) and dominates the import time of gentools,
+# while it is only needed when creating reusable generators.
+
+
+def _param_property(name):
+    def fget(self):
+        return self._gentools_arguments[name]
+
+    fget.__name__ = name
+    return property(fget)
+
+
+_reusable_classes = WeakValueDictionary()
 
 
 def reusable(func):
@@ -39,37 +51,123 @@ def reusable(func):
     * If bound to a class, the new reusable generator is callable as a method.
       To opt out of this, add a :func:`staticmethod` decorator above
       this decorator.
+    * Wrapping the same callable again returns the same class.
+      Changes to the class (such as setting its ``__qualname__``)
+      therefore also apply to the result of any other
+      ``reusable()`` call on that callable.
 
     """
+    # the class keeps a reference to the function, so its id is unique
+    # for as long as the class is alive.
+    try:
+        return _reusable_classes[id(func)]
+    except KeyError:
+        cls = _reusable_classes[id(func)] = _make_reusable(func)
+        return cls
+
+
+def _make_reusable(func):
+    from inspect import signature
+
     sig = signature(func)
     origin = func
     while hasattr(origin, "__wrapped__"):
         origin = origin.__wrapped__
-    return type(
-        origin.__name__,
-        (ReusableGenerator,),
-        dict(
-            [
-                ("__doc__", origin.__doc__),
-                ("__module__", origin.__module__),
-                ("__signature__", sig),
-                ("__wrapped__", staticmethod(func)),
-                ("__qualname__", origin.__qualname__),
-            ]
-            + [
-                (
-                    name,
-                    property(
-                        compose(
-                            itemgetter(name),
-                            attrgetter("_bound_args.arguments"),
-                        )
-                    ),
-                )
-                for name in sig.parameters
-            ]
-        ),
+    namespace = {
+        "__doc__": origin.__doc__,
+        "__module__": origin.__module__,
+        "__signature__": sig,
+        "__wrapped__": staticmethod(func),
+        "__qualname__": origin.__qualname__,
+        "__slots__": (),
+    }
+    namespace.update(_make_constructors(sig, origin.__qualname__))
+    for name in sig.parameters:
+        namespace[name] = _param_property(name)
+    return type(origin.__name__, (ReusableGenerator,), namespace)
+
+
+def _make_constructors(sig, qualname):
+    """generate ``__init__`` and ``_gentools_from_arguments`` for a signature.
+    Python's own argument parsing is much faster than ``Signature.bind()``.
+    """
+    from inspect import Parameter
+
+    taken = set(sig.parameters)
+
+    def unique(name):
+        while name in taken:
+            name = "_" + name
+        taken.add(name)
+        return name
+
+    instance = unique("self")
+    namespace = {}
+    # the instance is positional-only, so it can't clash with **kwargs
+    params = [instance]
+    args, kwargs, call = [], [], []
+    positional_only, keyword_only = True, False
+    for name, param in sig.parameters.items():
+        if positional_only and param.kind is not Parameter.POSITIONAL_ONLY:
+            params.append("/")
+            positional_only = False
+        argument = "arguments[{!r}]".format(name)
+        if param.kind is Parameter.VAR_POSITIONAL:
+            params.append("*" + name)
+            args.append("*" + name)
+            call.append("*" + argument)
+            keyword_only = True
+            continue
+        elif param.kind is Parameter.VAR_KEYWORD:
+            params.append("**" + name)
+            kwargs.append("**" + name)
+            call.append("**" + argument)
+            continue
+        elif param.kind is Parameter.KEYWORD_ONLY:
+            kwargs.append("{0!r}: {0}".format(name))
+            call.append("{}={}".format(name, argument))
+            if not keyword_only:
+                params.append("*")
+                keyword_only = True
+        else:
+            args.append(name)
+            call.append(argument)
+            positional_only = param.kind is Parameter.POSITIONAL_ONLY
+        if param.default is Parameter.empty:
+            params.append(name)
+        else:
+            default = unique("default_" + name)
+            namespace[default] = param.default
+            params.append("{}={}".format(name, default))
+    if positional_only:
+        params.append("/")
+
+    source = (
+        "def __init__({params}):\n"
+        "    {self}._gentools_args = ({args})\n"
+        "    {self}._gentools_kwargs = {{{kwargs}}}\n"
+        "    {self}._gentools_arguments = {{{arguments}}}\n"
+        "def _gentools_from_arguments(cls, arguments):\n"
+        "    return cls({call})\n"
+    ).format(
+        params=", ".join(params),
+        self=instance,
+        args="".join(arg + ", " for arg in args),
+        kwargs=", ".join(kwargs),
+        arguments=", ".join("{0!r}: {0}".format(n) for n in sig.parameters),
+        call=", ".join(call),
     )
+    exec(source, namespace)
+    init, from_arguments = (
+        namespace["__init__"],
+        namespace["_gentools_from_arguments"],
+    )
+    init.__qualname__ = qualname + ".__init__"
+    from_arguments.__qualname__ = qualname + "._gentools_from_arguments"
+    return {
+        "__init__": init,
+        "_gentools_from_arguments": classmethod(from_arguments),
+    }
 
 
 class oneyield(GeneratorCallable[T_yield, T_send, T_send]):
@@ -79,6 +177,8 @@ class oneyield(GeneratorCallable[T_yield, T_send, T_send]):
     and then returns the value it is sent (with ``send()``).
     """
 
+    __slots__ = ("__wrapped__",)
+
     def __init__(self, func):
         self.__wrapped__ = func
 
@@ -86,66 +186,34 @@ class oneyield(GeneratorCallable[T_yield, T_send, T_send]):
         return (yield self.__wrapped__(*args, **kwargs))
 
 
-class _raw_yield_from(object):
-    __slots__ = ("result", "_finished", "_gen", "_sent", "_next")
+def _throw(gen, exc):
+    """throw an exception into a generator (or re-raise it for iterators),
+    returning the next yielded value"""
+    throw = getattr(gen, "throw", None)
+    if throw is None:
+        if isinstance(exc, StopIteration):
+            # as a generator would (PEP 479), instead of ending silently
+            raise RuntimeError("generator raised StopIteration") from exc
+        raise exc
+    return throw(exc)
 
-    def __init__(self, gen):
-        self._finished = False
-        self._gen = iter(gen)
-        try:
-            self._next = next(self._gen)
-        except StopIteration as e:
-            self.result = e.value
-            self._finished = True
 
-    def __iter__(self):
-        return self
+def _sender(gen):
+    """get a send() function for any iterator, including non-generators"""
+    try:
+        return gen.send
+    except AttributeError:
 
-    def __next__(self):
-        if self._finished:
-            raise StopIteration()
-        self._sent = None
-        return self._next
+        def send(value):
+            return next(gen) if value is None else gen.send(value)
 
-    def send(self, value):
-        self._sent = value
+        return send
 
-    def __enter__(self):
-        return self
 
-    def __exit__(self, exc_cls, exc, tb):
-        # the following code is adapted from
-        # www.python.org/dev/peps/pep-0380/#formal-semantics
-        if exc_cls is None:
-            try:
-                if self._sent is None:
-                    self._next = next(self._gen)
-                else:
-                    self._next = self._gen.send(self._sent)
-            except StopIteration as _e:
-                self._finished = True
-                self.result = _e.value
-        elif issubclass(exc_cls, GeneratorExit):
-            try:
-                close = self._gen.close
-            except AttributeError:
-                pass
-            else:
-                close()
-            raise exc
-        else:
-            _x = (exc_cls, exc, tb)
-            try:
-                throw = self._gen.throw
-            except AttributeError:
-                raise exc
-            else:
-                try:
-                    self._next = throw(*_x)
-                except StopIteration as _e:
-                    self._finished = True
-                    self.result = _e.value
-                return True
+def _close(gen):
+    close = getattr(gen, "close", None)
+    if close is not None:
+        close()
 
 
 def sendreturn(gen, value):
@@ -191,13 +259,24 @@ def imap_yield(func, gen):
     ~typing.Generator[T_mapped, T_send, T_return]
         the mapped generator
     """
+    # the following loop is adapted from
+    # www.python.org/dev/peps/pep-0380/#formal-semantics
     gen = iter(gen)
-    assert _is_just_started(gen)
-    yielder = _raw_yield_from(gen)
-    for item in yielder:
-        with yielder:
-            yielder.send((yield func(item)))
-    return yielder.result
+    send = _sender(gen)
+    try:
+        item = next(gen)
+        while True:
+            try:
+                sent = yield func(item)
+            except GeneratorExit:
+                _close(gen)
+                raise
+            except BaseException as exc:
+                item = _throw(gen, exc)
+            else:
+                item = send(sent)
+    except StopIteration as e:
+        return e.value
 
 
 def imap_send(func, gen):
@@ -216,12 +295,21 @@ def imap_send(func, gen):
         the mapped generator
     """
     gen = iter(gen)
-    assert _is_just_started(gen)
-    yielder = _raw_yield_from(gen)
-    for item in yielder:
-        with yielder:
-            yielder.send(func((yield item)))
-    return yielder.result
+    send = _sender(gen)
+    try:
+        item = next(gen)
+        while True:
+            try:
+                sent = func((yield item))
+            except GeneratorExit:
+                _close(gen)
+                raise
+            except BaseException as exc:
+                item = _throw(gen, exc)
+            else:
+                item = send(sent)
+    except StopIteration as e:
+        return e.value
 
 
 def imap_return(func, gen):
@@ -239,12 +327,22 @@ def imap_return(func, gen):
     ~typing.Generator[T_yield, T_send, T_mapped]
     """
     gen = iter(gen)
-    assert _is_just_started(gen)
-    yielder = _raw_yield_from(gen)
-    for item in yielder:
-        with yielder:
-            yielder.send((yield item))
-    return func(yielder.result)
+    send = _sender(gen)
+    try:
+        item = next(gen)
+        while True:
+            try:
+                sent = yield item
+            except GeneratorExit:
+                _close(gen)
+                raise
+            except BaseException as exc:
+                item = _throw(gen, exc)
+            else:
+                item = send(sent)
+    except StopIteration as e:
+        result = e.value
+    return func(result)
 
 
 def irelay(gen, thru):
@@ -264,20 +362,92 @@ def irelay(gen, thru):
         the relayed generator
     """
     gen = iter(gen)
-    assert _is_just_started(gen)
+    send = _sender(gen)
+    try:
+        item = next(gen)
+        while True:
+            try:
+                sent = yield from thru(item)
+            except GeneratorExit:
+                _close(gen)
+                raise
+            except BaseException as exc:
+                item = _throw(gen, exc)
+            else:
+                item = send(sent)
+    except StopIteration as e:
+        return e.value
 
-    yielder = _raw_yield_from(gen)
-    for item in yielder:
-        with yielder:
-            subgen = thru(item)
-            subyielder = _raw_yield_from(subgen)
-            for subitem in subyielder:
-                with subyielder:
-                    subyielder.send((yield subitem))
 
-            yielder.send(subyielder.result)
+def _compose_mapper(funcs):
+    # mappers are called for every item, so avoid wrapping
+    # in a compose object where possible
+    funcs = tuple(f for f in funcs if f is not identity)
+    if not funcs:
+        return identity
+    elif len(funcs) == 1:
+        return funcs[0]
+    elif len(funcs) == 2:
+        outer, inner = funcs
+        return lambda value: outer(inner(value))
+    return compose(*funcs)
 
-    return yielder.result
+
+def _imap(yield_func, send_func, return_func, gen):
+    """apply functions to the yield, send, and return values of a generator,
+    in one generator layer"""
+    gen = iter(gen)
+    send = _sender(gen)
+    try:
+        item = next(gen)
+        while True:
+            try:
+                sent = send_func((yield yield_func(item)))
+            except GeneratorExit:
+                _close(gen)
+                raise
+            except BaseException as exc:
+                item = _throw(gen, exc)
+            else:
+                item = send(sent)
+    except StopIteration as e:
+        result = e.value
+    return return_func(result)
+
+
+def _map(func, yield_func=identity, send_func=identity, return_func=identity):
+    """wrap a generator callable to map its yield, send, and return values.
+    Stacked map_* decorators are merged into one wrapper,
+    so that each generator is only wrapped once."""
+    if yield_func is send_func is return_func is identity:
+        return func
+    mapping = getattr(func, "_gentools_mapping", None)
+    # other decorators may have copied the attribute with functools.wraps().
+    # Only our own wrappers directly wrap the mapped function.
+    if (
+        mapping is not None
+        and getattr(func, "__wrapped__", None) is mapping[0]
+    ):
+        func, inner_yield, inner_send, inner_return = mapping
+        yield_func = _compose_mapper((yield_func, inner_yield))
+        send_func = _compose_mapper((inner_send, send_func))
+        return_func = _compose_mapper((return_func, inner_return))
+
+    if send_func is identity and return_func is identity:
+        imap, mappers = imap_yield, (yield_func,)
+    elif yield_func is identity and return_func is identity:
+        imap, mappers = imap_send, (send_func,)
+    elif yield_func is identity and send_func is identity:
+        imap, mappers = imap_return, (return_func,)
+    else:
+        imap, mappers = _imap, (yield_func, send_func, return_func)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return imap(*mappers, func(*args, **kwargs))
+
+    wrapper._gentools_mapping = (func, yield_func, send_func, return_func)
+    return wrapper
 
 
 class map_yield:
@@ -308,11 +478,13 @@ class map_yield:
     :func:`~gentools.core.imap_yield`
     """
 
+    __slots__ = ("_mapper",)
+
     def __init__(self, *funcs):
-        self._mapper = compose(*funcs)
+        self._mapper = _compose_mapper(funcs)
 
     def __call__(self, func):
-        return compose(partial(imap_yield, self._mapper), func)
+        return _map(func, yield_func=self._mapper)
 
 
 class map_send:
@@ -343,11 +515,13 @@ class map_send:
     :func:`~gentools.core.imap_send`
     """
 
+    __slots__ = ("_mapper",)
+
     def __init__(self, *funcs):
-        self._mapper = compose(*funcs)
+        self._mapper = _compose_mapper(funcs)
 
     def __call__(self, func):
-        return compose(partial(imap_send, self._mapper), func)
+        return _map(func, send_func=self._mapper)
 
 
 class map_return:
@@ -378,11 +552,13 @@ class map_return:
     :func:`~gentools.core.imap_return`
     """
 
+    __slots__ = ("_mapper",)
+
     def __init__(self, *funcs):
-        self._mapper = compose(*funcs)
+        self._mapper = _compose_mapper(funcs)
 
     def __call__(self, func):
-        return compose(partial(imap_return, self._mapper), func)
+        return _map(func, return_func=self._mapper)
 
 
 class relay:
@@ -423,8 +599,32 @@ class relay:
     :func:`~gentools.core.irelay`
     """
 
+    __slots__ = ("_genfuncs",)
+
     def __init__(self, *genfuncs):
         self._genfuncs = genfuncs
 
     def __call__(self, func):
-        return compose(partial(reduce, irelay, self._genfuncs), func)
+        genfuncs = self._genfuncs
+
+        if all(isinstance(genfunc, oneyield) for genfunc in genfuncs):
+            # relaying through oneyield functions only maps the yielded values
+            mappers = [genfunc.__wrapped__ for genfunc in reversed(genfuncs)]
+            return _map(func, yield_func=_compose_mapper(mappers))
+        elif len(genfuncs) == 1:
+            (genfunc,) = genfuncs
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                return irelay(func(*args, **kwargs), genfunc)
+
+        else:
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                gen = func(*args, **kwargs)
+                for genfunc in genfuncs:
+                    gen = irelay(gen, genfunc)
+                return gen
+
+        return wrapper
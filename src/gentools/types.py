@@ -2,7 +2,6 @@
 
 import abc
 import typing as t
-from itertools import starmap
 from types import GeneratorType
 
 from .utils import CallableAsMethod
@@ -24,6 +23,8 @@ class Generable(t.Generic[T_yield, T_send, T_return], t.Iterable[T_yield]):
     returns a generator implements it.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __iter__(self):
         """
@@ -44,6 +45,8 @@ class GeneratorCallable(t.Generic[T_yield, T_send, T_return]):
     Note that :term:`generator functions <generator>` already implement this.
     """
 
+    __slots__ = ()
+
     def __call__(self, *args, **kwargs):
         """
 
@@ -70,28 +73,52 @@ class ReusableGenerator(
       the :func:`~gentools.core.reusable` decorator.
     """
 
-    def __init__(self, *args, **kwargs):
-        self._bound_args = self.__signature__.bind(*args, **kwargs)
-        self._bound_args.apply_defaults()
+    # internal names are prefixed, since the parameters of the generator
+    # function become properties of the subclass.
+    __slots__ = (
+        "_gentools_args",
+        "_gentools_kwargs",
+        "_gentools_arguments",
+        "_gentools_hash",
+        "__weakref__",
+    )
 
     def __iter__(self):
-        return self.__wrapped__(
-            *self._bound_args.args, **self._bound_args.kwargs
-        )
+        return self.__wrapped__(*self._gentools_args, **self._gentools_kwargs)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self._bound_args.arguments == other._bound_args.arguments
+            return self._gentools_arguments == other._gentools_arguments
         return NotImplemented
 
     def __repr__(self):
-        fields = starmap("{}={!r}".format, self._bound_args.arguments.items())
-        return "{}({})".format(self.__class__.__qualname__, ", ".join(fields))
+        fields = ", ".join(
+            f"{k}={v!r}" for k, v in self._gentools_arguments.items()
+        )
+        return f"{self.__class__.__qualname__}({fields})"
 
     def __hash__(self):
-        return hash(
-            (self._bound_args.args, tuple(self._bound_args.kwargs.items()))
-        )
+        # computed lazily, since the arguments may not be hashable
+        try:
+            return self._gentools_hash
+        except AttributeError:
+            self._gentools_hash = hash(
+                (self._gentools_args, tuple(self._gentools_kwargs.items()))
+            )
+            return self._gentools_hash
+
+    def __reduce__(self):
+        # rebuilt from the arguments, so that the cached hash isn't pickled.
+        # (hashes of strings, for example, differ between processes)
+        return self._gentools_from_arguments, (self._gentools_arguments,)
+
+    def __setstate__(self, state):
+        # only used by pickles from gentools <= 1.2,
+        # which stored the bound arguments in the instance __dict__
+        other = self._gentools_from_arguments(state["_bound_args"].arguments)
+        self._gentools_args = other._gentools_args
+        self._gentools_kwargs = other._gentools_kwargs
+        self._gentools_arguments = other._gentools_arguments
 
     def replace(self, **kwargs):
         """create a new instance with certain fields replaced
@@ -106,8 +133,6 @@ class ReusableGenerator(
         ReusableGenerator
             a copy with replaced fields
         """
-        copied = self.__signature__.bind(
-            *self._bound_args.args, **self._bound_args.kwargs
+        return self._gentools_from_arguments(
+            {**self._gentools_arguments, **kwargs}
         )
-        copied.arguments.update(**kwargs)
-        return self.__class__(*copied.args, **copied.kwargs)
@@ -1,17 +1,20 @@
 """Miscellaneous tools, boilerplate, and shortcuts"""
 
 from functools import partial
+from types import MethodType
 
 
 def identity(obj):
     return obj
 
 
-class CallableAsMethod(object):
+class CallableAsMethod:
     """mixin for callables to be callable as methods when bound to a class"""
 
+    __slots__ = ()
+
     def __get__(self, obj, objtype=None):
-        return self if obj is None else partial(self, obj)
+        return self if obj is None else MethodType(self, obj)
 
 
 class compose(CallableAsMethod):
@@ -27,28 +30,51 @@ class compose(CallableAsMethod):
     * if given no functions, acts as an identity function
     """
 
+    __slots__ = ("funcs", "__wrapped__", "_outer", "_hash", "__weakref__")
+
     def __init__(self, *funcs):
         self.funcs = funcs
         self.__wrapped__ = funcs[-1] if funcs else identity
+        # the functions applied to the result of __wrapped__, in call order
+        self._outer = funcs[-2::-1]
+
+    def __reduce__(self):
+        return (type(self), self.funcs)
+
+    def __setstate__(self, state):
+        # only used by pickles from gentools <= 1.2,
+        # which stored the functions in the instance __dict__
+        self.__init__(*state["funcs"])
+
+    def __get__(self, obj, objtype=None):
+        # bound methods are pickled by looking up their name on the
+        # instance, which doesn't work for nameless compose objects.
+        return self if obj is None else partial(self, obj)
 
     def __hash__(self):
-        return hash(self.funcs)
+        # computed lazily, since the functions may not be hashable
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self.funcs)
+            return self._hash
 
     def __eq__(self, other):
-        if isinstance(other, compose):
+        if other is self:
+            return True
+        elif isinstance(other, compose):
             return self.funcs == other.funcs
         return NotImplemented
 
     def __ne__(self, other):
-        if isinstance(other, compose):
+        if other is self:
+            return False
+        elif isinstance(other, compose):
             return self.funcs != other.funcs
         return NotImplemented
 
     def __call__(self, *args, **kwargs):
-        if not self.funcs:
-            return identity(*args, **kwargs)
-        tail, head = self.funcs[:-1], self.funcs[-1]
-        value = head(*args, **kwargs)
-        for func in reversed(tail):
+        value = self.__wrapped__(*args, **kwargs)
+        for func in self._outer:
             value = func(value)
         return value
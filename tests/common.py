@@ -57,6 +57,8 @@ def mymax(val):
 class MyMax:
     """an example generator iterable"""
 
+    __slots__ = ("start",)
+
     def __init__(self, start):
         self.start = start
 
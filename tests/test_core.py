@@ -1,7 +1,9 @@
+import copy
+import functools
 import pickle
 import types
-from functools import reduce
-from inspect import signature
+from collections.abc import Generator
+from inspect import signature, unwrap
 
 import pytest
 
@@ -18,11 +20,7 @@ from .common import (
     try_until_positive,
 )
 
-
-def unwrap(func):
-    while hasattr(func, "__wrapped__"):
-        func = func.__wrapped__
-    return func
+_format_result = "result: {}".format
 
 
 @gentools.reusable
@@ -31,6 +29,66 @@ def mygen(a, foo):
     yield foo
 
 
+class Parent:
+    __slots__ = ("foo",)
+
+    def __init__(self, foo):
+        self.foo = foo
+
+    @gentools.reusable
+    def mygen(self, value):
+        yield self.foo
+        yield value
+
+    # opt out with staticmethod
+    @staticmethod
+    @gentools.reusable
+    def staticgen(foo, bar):
+        yield foo
+        yield bar
+
+
+class mywrapper:
+    __slots__ = ("__wrapped__", "__signature__")
+
+    def __init__(self, func):
+        self.__wrapped__ = func
+        self.__signature__ = signature(func).replace(return_annotation=str)
+
+    def __call__(self, *args, **kwargs):
+        inner = self.__wrapped__(*args, **kwargs)
+        yield str(next(inner))
+
+
+@gentools.reusable
+@mywrapper  # dummy to test combining with other decorators
+def gentype(a, b, *cs, **fs):
+    """my docstring"""
+    return (yield sum([a, b, sum(cs), sum(fs.values()), a]))
+
+
+gentype.__qualname__ = "mymodule.gentype"
+
+
+class TestPackage:
+    def test_exports(self):
+        from gentools import core, types
+
+        assert set(gentools.__all__) == set(core.__all__) | set(types.__all__)
+        for name in core.__all__:
+            assert getattr(gentools, name) is getattr(core, name)
+        for name in types.__all__:
+            assert getattr(gentools, name) is getattr(types, name)
+        assert set(gentools.__all__) <= set(dir(gentools))
+
+    def test_version(self):
+        assert isinstance(gentools.__version__, str)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="foo"):
+            gentools.foo
+
+
 class TestYieldFrom:
     def test_throw_oneway(self):
         gen = delegator(iter([1, 2, 3]))
@@ -101,9 +159,108 @@ class TestYieldFrom:
 
 
 class TestReusable:
-    def test_picklable(self):
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_picklable(self, protocol):
+        gen = mygen(4, foo=5)
+        assert pickle.loads(pickle.dumps(gen, protocol)) == gen
+
+        hash(gen)
+        assert pickle.loads(pickle.dumps(gen, protocol)) == gen
+
+    def test_unpickle_legacy(self):
+        # mygen(1, foo=2), pickled with gentools 1.2.2
+        data = (
+            b"\x80\x02ctests.test_core\nmygen\n)\x81}X\x0b\x00\x00\x00_bound_a"
+            b"rgscinspect\nBoundArguments\n)\x81}(X\n\x00\x00\x00_signatu"
+            b"recinspect\nSignature\ncinspect\nParameter\nq\x00X\x01\x00\x00"
+            b"\x00aq\x01cinspect\n_ParameterKind\nK\x01\x85Rq\x02\x86R}(X\x08"
+            b"\x00\x00\x00_defaultq\x03cinspect\n_empty\nq\x04X\x0b\x00\x00"
+            b"\x00_annotationq\x05h\x04ubh\x00X\x03\x00\x00\x00fooq\x06h\x02"
+            b"\x86R}(h\x03h\x04h\x05h\x04ub\x86\x85R}X\x12\x00\x00\x00_retur"
+            b"n_annotationh\x04sbX\t\x00\x00\x00arguments}(h\x01K\x01h\x06K"
+            b"\x02uubsb."
+        )
+        gen = pickle.loads(data)
+        assert gen == mygen(1, foo=2)
+        assert hash(gen) == hash(mygen(1, foo=2))
+        assert list(gen) == [1, 2]
+
+    def test_copy(self):
+        gen = mygen(4, foo=5)
+        assert copy.copy(gen) == gen
+        assert copy.deepcopy(gen) == gen
+
+    def test_slots(self):
         gen = mygen(4, foo=5)
-        assert pickle.loads(pickle.dumps(gen)) == gen
+        assert not hasattr(gen, "__dict__")
+        with pytest.raises(AttributeError):
+            gen.bar = 3
+
+    def test_internal_names_as_parameters(self):
+        @gentools.reusable
+        def gen(_args, _kwargs, *, _arguments, _hash, _from_arguments=None):
+            yield _args + _kwargs + _arguments + _hash
+
+        instance = gen(1, 2, _arguments=3, _hash=4)
+        assert instance._args == 1
+        assert instance._hash == 4
+        assert next(iter(instance)) == 10
+        assert hash(instance) == hash(gen(1, 2, _arguments=3, _hash=4))
+        assert instance.replace(_hash=5) == gen(1, 2, _arguments=3, _hash=5)
+
+    def test_hash(self):
+        gen = mygen(4, foo=5)
+        assert hash(gen) == hash(gen) == hash(mygen(4, foo=5))
+
+        unhashable = mygen([], foo=5)
+        assert unhashable == mygen([], foo=5)
+        with pytest.raises(TypeError):
+            hash(unhashable)
+
+    def test_cached(self):
+        def func(a):
+            yield a
+
+        assert gentools.reusable(func) is gentools.reusable(func)
+
+    def test_positional_and_keyword_arguments(self):
+        @gentools.reusable
+        def func(a, b=2):
+            yield a
+            return b
+
+        by_position = func(1, 2)
+        by_keyword = func(b=2, a=1)
+        assert by_position == by_keyword == func(1)
+        assert hash(by_position) == hash(by_keyword)
+        assert repr(by_position) == repr(by_keyword)
+        assert repr(by_position).endswith("func(a=1, b=2)")
+        assert list(by_position) == [1]
+
+        with pytest.raises(TypeError):
+            func(1, 2, 3)
+
+    def test_signature_kinds(self):
+        default = object()
+
+        @gentools.reusable
+        def func(a, self, /, b=default, *cs, d, e=5, **fs):
+            yield a
+
+        gen = func(1, 2, d=4, self=6)
+        assert gen.a == 1
+        assert gen.self == 2
+        assert gen.b is default
+        assert gen.cs == ()
+        assert gen.e == 5
+        assert gen.fs == {"self": 6}
+        assert gen == func(1, 2, default, d=4, self=6)
+        assert type(gen).__init__.__qualname__.endswith("func.__init__")
+
+        with pytest.raises(TypeError):
+            func(1, 2)
+        with pytest.raises(TypeError):
+            func(a=1, self=2, d=4)
 
     def test_qualname(self):
         class Foo:
@@ -115,51 +272,17 @@ class TestReusable:
         assert Foo.bar.__qualname__.endswith("Foo.bar")
 
     def test_callable_as_method(self):
-        class Parent:
-            def __init__(self, foo):
-                self.foo = foo
-
-            @gentools.reusable
-            def mygen(self, value):
-                yield self.foo
-                yield value
-
-            # opt out with staticmethod
-            @staticmethod
-            @gentools.reusable
-            def staticgen(foo, bar):
-                yield foo
-                yield bar
-
         p = Parent(4)
 
         assert list(Parent.mygen(p, 8)) == [4, 8]
         gen = p.mygen(9)
         assert list(gen) == list(gen) == [4, 9]
+        assert list(pickle.loads(pickle.dumps(p.mygen))(9)) == [4, 9]
 
         assert list(Parent.staticgen(3, 9)) == [3, 9]
         assert list(p.staticgen(3, 9)) == [3, 9]
 
     def test_example(self):
-        class mywrapper:
-            def __init__(self, func):
-                self.__wrapped__ = func
-                self.__signature__ = signature(func).replace(
-                    return_annotation=str
-                )
-
-            def __call__(self, *args, **kwargs):
-                inner = self.__wrapped__(*args, **kwargs)
-                yield str(next(inner))
-
-        @gentools.reusable
-        @mywrapper  # dummy to test combining with other decorators
-        def gentype(a, b, *cs, **fs):
-            """my docstring"""
-            return (yield sum([a, b, sum(cs), sum(fs.values()), a]))
-
-        gentype.__qualname__ = "mymodule.gentype"
-
         assert issubclass(gentype, gentools.Generable)
         assert isinstance(unwrap, types.FunctionType)
         gentype.__name__ == "myfunc"
@@ -225,6 +348,19 @@ class TestIMapYield:
         assert mapped.send(3) == "7"
         assert gentools.sendreturn(mapped, 103) == 309
 
+    def test_any_iterator(self):
+        mapped = gentools.imap_yield(str, iter([1, 2, 3]))
+        assert list(mapped) == ["1", "2", "3"]
+
+    @pytest.mark.parametrize("make_iter", [iter, lambda x: (i for i in x)])
+    def test_stopiteration_from_mapper(self, make_iter):
+        def func(value):
+            raise StopIteration()
+
+        mapped = gentools.imap_yield(func, make_iter([1, 2]))
+        with pytest.raises(RuntimeError, match="raised StopIteration"):
+            list(mapped)
+
 
 class TestIMapSend:
     def test_empty(self):
@@ -304,8 +440,8 @@ class TestIRelay:
         assert gentools.sendreturn(relayed, 102) == 306
 
     def test_accumulate(self):
-        gen = reduce(
-            gentools.irelay, [try_until_even, try_until_positive], mymax(4)
+        gen = gentools.irelay(
+            gentools.irelay(mymax(4), try_until_even), try_until_positive
         )
 
         assert next(gen) == 4
@@ -317,7 +453,7 @@ class TestIRelay:
 
 def test_combine_mappers():
     gen = gentools.imap_return(
-        "result: {}".format,
+        _format_result,
         gentools.imap_send(
             int,
             gentools.imap_yield(
@@ -342,6 +478,50 @@ def test_oneyield():
     assert unwrap(myfunc).__name__ == "myfunc"
     assert next(gen) == 6
     assert gentools.sendreturn(gen, 9) == 9
+    with pytest.raises(StopIteration):
+        next(gen)
+
+
+def test_oneyield_generator_protocol():
+    calls = []
+
+    @gentools.oneyield
+    def myfunc(a):
+        calls.append(a)
+        return a
+
+    gen = myfunc(1)
+    assert isinstance(gen, Generator)
+    assert isinstance(gen, gentools.Generable)
+    assert iter(gen) is gen
+    assert calls == []  # called lazily, like a generator
+    with pytest.raises(TypeError, match="just-started"):
+        gen.send(4)
+
+    gen = myfunc(2)
+    assert next(gen) == 2
+    with pytest.raises(ValueError):
+        gen.throw(ValueError)
+    assert list(gen) == []
+
+    gen = myfunc(3)
+    gen.close()
+    assert list(gen) == []
+    assert calls == [2]
+
+
+def test_oneyield_stopiteration():
+    @gentools.oneyield
+    def myfunc():
+        raise StopIteration()
+
+    with pytest.raises(RuntimeError, match="raised StopIteration"):
+        list(myfunc())
+
+    relayed = gentools.irelay(mymax(4), gentools.oneyield(str))
+    next(relayed)
+    with pytest.raises(RuntimeError, match="raised StopIteration"):
+        relayed.throw(StopIteration(42))
 
 
 def test_relay():
@@ -356,8 +536,25 @@ def test_relay():
     assert gentools.sendreturn(gen, 102) == 306
 
 
+def test_relay_oneyield():
+    double = gentools.oneyield(lambda x: x * 2)
+    decorated = gentools.relay(double, gentools.oneyield(str))(mymax)
+    assert decorated.__name__ == "mymax"
+
+    gen = decorated(4)
+    assert next(gen) == "8"
+    assert gen.send(7) == "14"
+    assert gen.send(2) == "14"
+    assert gentools.sendreturn(gen, 102) == 306
+
+    assert list(gentools.relay(double)(emptygen)()) == []
+    assert gentools.relay()(mymax) is mymax
+
+
 def test_map_yield():
     decorated = gentools.map_yield(str, lambda x: x * 2)(mymax)
+    assert decorated.__name__ == "mymax"
+    assert decorated.__doc__ == mymax.__doc__
 
     gen = decorated(5)
     assert next(gen) == "10"
@@ -385,9 +582,70 @@ def test_map_return():
     assert gentools.sendreturn(gen, 103) == " 309 "
 
 
+def test_mappers_without_functions():
+    for decorator in (
+        gentools.map_yield(),
+        gentools.map_send(),
+        gentools.map_return(),
+    ):
+        assert decorator(mymax) is mymax
+
+
+def test_stacking_mappers():
+    @gentools.map_return(_format_result)
+    @gentools.map_yield(str)
+    @gentools.map_send(int)
+    @gentools.map_return(lambda x: x - 1)
+    @gentools.map_send(lambda x: x * 2)
+    @gentools.map_yield(lambda x: x + 1)
+    def decorated(value):
+        return mymax(value)
+
+    gen = decorated(4)
+    assert next(gen) == "5"
+    assert gen.send("5") == "11"
+    assert gentools.sendreturn(gen, "60") == "result: 359"
+    assert unwrap(decorated).__name__ == "decorated"
+
+
+def test_stacking_mappers_with_other_decorator():
+    def logged(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    calls = []
+    decorated = gentools.map_yield(str)(logged(gentools.map_send(int)(mymax)))
+
+    gen = decorated(4)
+    assert next(gen) == "4"
+    assert gen.send("8") == "8"
+    assert calls == [(4,)]
+
+
+def test_stacking_mappers_with_copied_attributes():
+    def logged(*args, **kwargs):
+        calls.append(args)
+        return inner(*args, **kwargs)
+
+    calls = []
+    inner = gentools.map_send(int)(mymax)
+    logged.__dict__.update(inner.__dict__)
+    del logged.__wrapped__
+    decorated = gentools.map_yield(str)(logged)
+
+    gen = decorated(4)
+    assert next(gen) == "4"
+    assert gen.send("8") == "8"
+    assert calls == [(4,)]
+
+
 def test_combining_decorators():
     decorators = compose(
-        gentools.map_return("result: {}".format),
+        gentools.map_return(_format_result),
         gentools.map_send(int),
         gentools.map_yield(str),
         gentools.relay(try_until_even),
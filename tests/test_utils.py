@@ -1,3 +1,5 @@
+import pickle
+from dataclasses import dataclass
 from inspect import signature
 from operator import attrgetter
 
@@ -9,6 +11,15 @@ def test_identity():
     assert utils.identity(obj) is obj
 
 
+class Number:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    as_text = utils.compose(str, attrgetter("value"))
+
+
 class TestCompose:
     def test_part_of_main_api(self):
         from gentools import compose
@@ -24,7 +35,9 @@ class TestCompose:
         assert signature(func) == signature(utils.identity)
 
     def test_called_as_method(self):
-        class Foo(object):
+        class Foo:
+            __slots__ = ("value",)
+
             def __init__(self, value):
                 self.value = value
 
@@ -34,6 +47,10 @@ class TestCompose:
         assert Foo.func(f) == 5
         assert f.func() == 5
 
+    def test_bound_method_picklable(self):
+        method = pickle.loads(pickle.dumps(Number(4).as_text))
+        assert method() == "4"
+
     def test_one_func_with_multiple_args(self):
         func = utils.compose(int)
         assert func("10", base=5) == 5
@@ -45,6 +62,48 @@ class TestCompose:
         assert isinstance(func.funcs, tuple)
         assert func("30", base=5) == "16"
 
+    def test_slots(self):
+        assert not hasattr(utils.compose(int, str), "__dict__")
+
+    def test_picklable(self):
+        func = utils.compose(int, str)
+        assert pickle.loads(pickle.dumps(func)) == func
+
+    def test_unpickle_legacy(self):
+        # compose(int, str), pickled with gentools 1.2.2
+        data = (
+            b"\x80\x02cgentools.utils\ncompose\n)\x81}(X\x05\x00\x00\x00f"
+            b"uncsc__builtin__\nlong\nc__builtin__\nunicode\nq\x00\x86X\x0b"
+            b"\x00\x00\x00__wrapped__h\x00ub."
+        )
+        func = pickle.loads(data)
+        assert func == utils.compose(int, str)
+        assert func("4") == 4
+
+    def test_unhashable_funcs(self):
+        class Unhashable:
+            __hash__ = None
+
+            def __call__(self, value):
+                return value
+
+        func = utils.compose(Unhashable(), int)
+        assert func("5") == 5
+
+    def test_equal_funcs(self):
+        @dataclass(frozen=True)
+        class Scale:
+            factor: float
+
+            def __call__(self, value):
+                return value * self.factor
+
+        func = utils.compose(Scale(1))
+        other = utils.compose(Scale(1.0))
+        assert isinstance(other(3), float)
+        assert other == func
+        assert not other != func
+
     def test_equality(self):
         func = utils.compose(int, str)
         other = utils.compose(int, str)